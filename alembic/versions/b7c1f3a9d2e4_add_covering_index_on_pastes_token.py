@@ -0,0 +1,33 @@
+"""Add covering index on pastes.token for the GET hot path
+
+Revision ID: b7c1f3a9d2e4
+Revises: 67860367e893
+Create Date: 2026-08-28 10:12:03.118244
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c1f3a9d2e4'
+down_revision: Union[str, Sequence[str], None] = '67860367e893'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_pastes_token_covering',
+        'pastes',
+        ['token'],
+        unique=False,
+        postgresql_include=['expires_at', 'sha256'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_pastes_token_covering', table_name='pastes')
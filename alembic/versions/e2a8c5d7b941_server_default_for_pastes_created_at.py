@@ -0,0 +1,41 @@
+"""Server-side default for pastes.created_at
+
+Revision ID: e2a8c5d7b941
+Revises: b7c1f3a9d2e4
+Create Date: 2026-08-28 14:37:51.902416
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a8c5d7b941'
+down_revision: Union[str, Sequence[str], None] = 'b7c1f3a9d2e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'pastes',
+        'created_at',
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        server_default=sa.func.now(),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'pastes',
+        'created_at',
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        server_default=None,
+    )
@@ -19,6 +19,8 @@ class PasteCreateRequest(pydantic.BaseModel):
     )
     filename: str | None = None
 
+    model_config = pydantic.ConfigDict(extra='forbid', frozen=True)
+
 
 class PasteResponse(pydantic.BaseModel):
     """Response model for paste metadata."""
@@ -55,18 +55,36 @@ async def get_paste(
 async def get_paste_content(
     token: str,
     storage: base.PasteStorage = fastapi.Depends(dependencies.get_storage),
+    if_none_match: str | None = fastapi.Header(default=None),
 ) -> fastapi.responses.Response:
     """Retrieve raw paste content."""
-    stored_paste = await storage.get(token)
+    # Revalidation short-circuit: compare ETags before loading the body, so
+    # a cache hit only costs the cheap metadata lookup.
+    if if_none_match is not None:
+        etag = await storage.get_etag(token)
 
-    if stored_paste is None:
+        if etag is None:
+            raise fastapi.HTTPException(status_code=404, detail="Paste not found or expired")
+
+        if etag == if_none_match:
+            return fastapi.responses.Response(
+                status_code=304,
+                headers={
+                    'Cache-Control': 'no-store',
+                    'ETag': etag,
+                },
+            )
+
+    paste_content = await storage.get_content(token)
+
+    if paste_content is None:
         raise fastapi.HTTPException(status_code=404, detail="Paste not found or expired")
 
     return fastapi.responses.Response(
-        content=stored_paste.content,
-        media_type=stored_paste.content_type,
+        content=paste_content.content_bytes,
+        media_type=paste_content.content_type,
         headers={
             'Cache-Control': 'no-store',
-            'ETag': f'"{stored_paste.sha256}"',
+            'ETag': paste_content.etag,
         },
     )
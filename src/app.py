@@ -1,11 +1,46 @@
+import asyncio
+import contextlib
+
 import fastapi
 
 import src.api.pastes
+import src.dependencies
+
+CLEANUP_INTERVAL_SECONDS = 60
+
+
+async def _cleanup_expired_loop() -> None:
+    """Periodically sweep expired pastes from the shared in-memory storage."""
+    storage = await src.dependencies.get_memory_storage()
+    while True:
+        await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
+        await storage.cleanup_expired()
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: fastapi.FastAPI):
+    """Run startup/shutdown logic around the application's lifetime."""
+    # In memory mode the read path does not evict expired pastes, so a
+    # background sweeper reclaims them; SQL mode relies on cleanup_expired
+    # being invoked externally (e.g. a cron job).
+    cleanup_task = None
+    if src.dependencies.STORAGE_TYPE == 'memory':
+        cleanup_task = asyncio.create_task(_cleanup_expired_loop())
+
+    yield
+
+    if cleanup_task is not None:
+        cleanup_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await cleanup_task
+
 
 app = fastapi.FastAPI(
     title="Shared Notes API",
     description="A simple notes sharing service",
     version='0.1.0',
+    default_response_class=fastapi.responses.ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Include API routers
@@ -5,28 +5,46 @@ import os
 import fastapi
 import sqlalchemy.ext.asyncio
 
-from src.storage import base, db, factory
+from src.storage import base, db, factory, utils
 
 STORAGE_TYPE: base.StorageType = os.getenv('STORAGE_TYPE', 'sql').lower()
+WORKER_ID: int = int(os.getenv('WORKER_ID', '0'))
 
+# Shared across requests: the token generator owns the Snowflake sequence
+# state (per-request generators could collide within one millisecond), and
+# the in-memory backend would lose every paste if rebuilt per request.
+_token_generator = utils.TokenGenerator(worker_id=WORKER_ID)
+_memory_storage = factory.create_storage(storage_type='memory', token_generator=_token_generator)
 
-async def get_storage(
+
+async def get_sql_storage(
     db_session: sqlalchemy.ext.asyncio.AsyncSession = fastapi.Depends(db.get_db),
 ) -> base.PasteStorage:
     """
-    Get the storage instance via dependency injection.
-
-    The storage type is determined by the STORAGE_TYPE environment variable.
-    - 'sql' (default): Uses PostgreSQL with the provided session
-    - 'memory': Uses in-memory storage (session is ignored)
+    Get the SQL storage instance backed by a per-request database session.
 
     Args:
         db_session: Database session from FastAPI dependency
 
     Returns:
-        Storage instance based on configuration
+        SQL storage instance
+    """
+    return factory.create_storage(storage_type='sql', session=db_session, token_generator=_token_generator)
+
+
+async def get_memory_storage() -> base.PasteStorage:
     """
-    if STORAGE_TYPE == 'sql':
-        return factory.create_storage(storage_type='sql', session=db_session)
-    else:
-        return factory.create_storage(storage_type='memory')
+    Get the shared in-memory storage instance.
+
+    Deliberately declares no database dependency, so memory mode never
+    opens (or commits) a PostgreSQL session per request.
+
+    Returns:
+        In-memory storage instance
+    """
+    return _memory_storage
+
+
+# Resolve the storage dispatch once at import time so get_storage does not
+# re-compare the configured type string on every request.
+get_storage = get_sql_storage if STORAGE_TYPE == 'sql' else get_memory_storage
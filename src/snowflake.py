@@ -1,4 +1,6 @@
 import datetime
+import threading
+import time
 
 
 class SnowflakeGenerator:
@@ -16,20 +18,27 @@ class SnowflakeGenerator:
         self.worker_id = worker_id
         self.last_ts = 0
         self.sequence = 0
+        # Worker bits never change, so shift them into place once
+        self._worker_shifted = worker_id << self.WORKER_ID_SHIFT
+        self._lock = threading.Lock()
 
     def _now(self):
-        return int(datetime.datetime.now(datetime.timezone.utc).timestamp() * 1000) - self.EPOCH
+        # time_ns avoids the datetime allocation + float round-trip per ID
+        return time.time_ns() // 1_000_000 - self.EPOCH
 
     def generate_id(self) -> int:
-        ts = self._now()
-        if ts < self.last_ts:
-            raise RuntimeError("Clock moved backwards")
-        if ts == self.last_ts:
-            self.sequence = (self.sequence + 1) & self.MAX_SEQUENCE
-            if self.sequence == 0:
-                while (ts := self._now()) == self.last_ts:
-                    pass
-        else:
-            self.sequence = 0
-        self.last_ts = ts
-        return (ts << self.TIMESTAMP_SHIFT) | (self.worker_id << self.WORKER_ID_SHIFT) | self.sequence
+        # Guard last_ts/sequence so generators shared across threads (or event
+        # loops in separate threads) never hand out duplicate IDs
+        with self._lock:
+            ts = self._now()
+            if ts < self.last_ts:
+                raise RuntimeError("Clock moved backwards")
+            if ts == self.last_ts:
+                self.sequence = (self.sequence + 1) & self.MAX_SEQUENCE
+                if self.sequence == 0:
+                    while (ts := self._now()) == self.last_ts:
+                        pass
+            else:
+                self.sequence = 0
+            self.last_ts = ts
+            return (ts << self.TIMESTAMP_SHIFT) | self._worker_shifted | self.sequence
@@ -8,19 +8,30 @@ import typing
 StorageType = typing.Literal['sql', 'memory']
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class StoredPaste:
     """Internal representation of a stored paste."""
 
     token: str
     content: str
+    content_bytes: bytes
     content_type: str
     size_bytes: int
     sha256: str
+    etag: str
     created_at: datetime.datetime
     expires_at: datetime.datetime
 
 
+@dataclasses.dataclass(slots=True)
+class PasteContent:
+    """Raw payload of a paste, as served by the content endpoint."""
+
+    content_bytes: bytes
+    content_type: str
+    etag: str
+
+
 class PasteStorage(abc.ABC):
     """Abstract base class for paste storage implementations."""
 
@@ -57,6 +68,38 @@ class PasteStorage(abc.ABC):
         """
         ...
 
+    @abc.abstractmethod
+    async def get_content(self, token: str) -> PasteContent | None:
+        """
+        Retrieve only the raw content payload of a paste.
+
+        Cheaper than get() for serving the paste body: implementations can
+        skip the metadata columns the content endpoint never touches.
+
+        Args:
+            token: The paste token
+
+        Returns:
+            The content payload, or None if not found or expired
+        """
+        ...
+
+    @abc.abstractmethod
+    async def get_etag(self, token: str) -> str | None:
+        """
+        Retrieve only the ETag of a paste.
+
+        Used for If-None-Match revalidation: a match lets the handler answer
+        304 without ever loading the paste body.
+
+        Args:
+            token: The paste token
+
+        Returns:
+            The ETag, or None if not found or expired
+        """
+        ...
+
     @abc.abstractmethod
     async def cleanup_expired(self) -> int:
         """
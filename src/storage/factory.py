@@ -5,12 +5,14 @@ import sqlalchemy.ext.asyncio
 import src.storage.base
 import src.storage.memory
 import src.storage.sql
+import src.storage.utils
 
 
 def create_storage(
     storage_type: src.storage.base.StorageType,
     session: sqlalchemy.ext.asyncio.AsyncSession | None = None,
     worker_id: int = 0,
+    token_generator: src.storage.utils.TokenGenerator | None = None,
 ) -> src.storage.base.PasteStorage:
     """
     Create a storage instance based on type.
@@ -19,6 +21,7 @@ def create_storage(
         storage_type: Type of storage ('sql' or 'memory')
         session: SQLAlchemy async session (required only for SQL storage)
         worker_id: Worker ID for Snowflake generator
+        token_generator: Shared token generator to use instead of creating one
 
     Returns:
         Storage instance
@@ -29,8 +32,8 @@ def create_storage(
     if storage_type == 'sql':
         if session is None:
             raise ValueError("SQL storage requires a database session")
-        return src.storage.sql.SQLPasteStorage(session=session, worker_id=worker_id)
+        return src.storage.sql.SQLPasteStorage(session=session, worker_id=worker_id, token_generator=token_generator)
     elif storage_type == 'memory':
-        return src.storage.memory.InMemoryPasteStorage(worker_id=worker_id)
+        return src.storage.memory.InMemoryPasteStorage(worker_id=worker_id, token_generator=token_generator)
     else:
         raise ValueError(f"Unknown storage type: {storage_type}")
@@ -1,6 +1,7 @@
 """In-memory storage implementation for pastes."""
 
 import datetime
+import heapq
 
 import src.storage.base
 import src.storage.utils
@@ -9,15 +10,22 @@ import src.storage.utils
 class InMemoryPasteStorage(src.storage.base.PasteStorage):
     """In-memory storage for pastes."""
 
-    def __init__(self, worker_id: int = 0) -> None:
+    def __init__(
+        self,
+        worker_id: int = 0,
+        token_generator: src.storage.utils.TokenGenerator | None = None,
+    ) -> None:
         """
         Initialize the in-memory storage.
 
         Args:
             worker_id: Unique worker ID for Snowflake generator (0-1023)
+            token_generator: Shared token generator; a new one is created if omitted
         """
         self._pastes: dict[str, src.storage.base.StoredPaste] = {}
-        self._token_generator = src.storage.utils.TokenGenerator(worker_id=worker_id)
+        # Min-heap of (expires_at, token) so cleanup only touches the expired prefix
+        self._expiry_heap: list[tuple[datetime.datetime, str]] = []
+        self._token_generator = token_generator or src.storage.utils.TokenGenerator(worker_id=worker_id)
 
     async def create(
         self,
@@ -34,17 +42,22 @@ class InMemoryPasteStorage(src.storage.base.PasteStorage):
             # This should never happen with Snowflake
             raise RuntimeError(f"Token collision detected: {token}")
 
+        content_bytes = content.encode('utf-8')
+        sha256 = src.storage.utils.compute_sha256(content_bytes)
         paste = src.storage.base.StoredPaste(
             token=token,
             content=content,
+            content_bytes=content_bytes,
             content_type=content_type,
-            size_bytes=len(content.encode('utf-8')),
-            sha256=src.storage.utils.compute_sha256(content),
+            size_bytes=len(content_bytes),
+            sha256=sha256,
+            etag=f'"{sha256}"',
             created_at=now,
             expires_at=now + datetime.timedelta(seconds=expires_in_seconds),
         )
 
         self._pastes[token] = paste
+        heapq.heappush(self._expiry_heap, (paste.expires_at, token))
         return paste
 
     async def get(self, token: str) -> src.storage.base.StoredPaste | None:
@@ -54,21 +67,46 @@ class InMemoryPasteStorage(src.storage.base.PasteStorage):
         if paste is None:
             return None
 
-        # Check if expired
+        # Check if expired; eviction is left to cleanup_expired so the
+        # read path never mutates the dict
         now = datetime.datetime.now(datetime.timezone.utc)
         if now >= paste.expires_at:
-            # Clean up expired paste
-            del self._pastes[token]
             return None
 
         return paste
 
+    async def get_content(self, token: str) -> src.storage.base.PasteContent | None:
+        """Retrieve only the raw content payload of a paste."""
+        paste = await self.get(token)
+
+        if paste is None:
+            return None
+
+        return src.storage.base.PasteContent(
+            content_bytes=paste.content_bytes,
+            content_type=paste.content_type,
+            etag=paste.etag,
+        )
+
+    async def get_etag(self, token: str) -> str | None:
+        """Retrieve only the ETag of a paste."""
+        paste = await self.get(token)
+
+        if paste is None:
+            return None
+
+        return paste.etag
+
     async def cleanup_expired(self) -> int:
         """Remove all expired pastes. Returns count of removed pastes."""
         now = datetime.datetime.now(datetime.timezone.utc)
-        expired_tokens = [token for token, paste in self._pastes.items() if now >= paste.expires_at]
+        removed_count = 0
 
-        for token in expired_tokens:
-            del self._pastes[token]
+        # Pop only the expired prefix of the heap: O(k log n) for k expired
+        # pastes instead of a full O(n) scan over the dict.
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, token = heapq.heappop(self._expiry_heap)
+            if self._pastes.pop(token, None) is not None:
+                removed_count += 1
 
-        return len(expired_tokens)
+        return removed_count
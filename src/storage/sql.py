@@ -1,13 +1,48 @@
 """SQL storage implementation for pastes using SQLAlchemy Core."""
 
-import datetime
-
 import sqlalchemy
 import sqlalchemy.ext.asyncio
 
 from src.storage import base, utils
 from src.storage.db import models
 
+# Columns materialized into StoredPaste; selecting them explicitly keeps
+# results as plain Core rows, skipping ORM instrumentation and the identity
+# map on the read path.
+_PASTE_COLUMNS = (
+    models.Paste.token,
+    models.Paste.content,
+    models.Paste.content_type,
+    models.Paste.size_bytes,
+    models.Paste.sha256,
+    models.Paste.created_at,
+    models.Paste.expires_at,
+)
+
+# Statements built once at import: skips the per-call select()/delete()
+# builder allocations and keeps the compiled SQL text stable, which is what
+# asyncpg's prepared-statement cache keys on.
+_INSERT_STMT = sqlalchemy.insert(models.Paste)
+_GET_STMT = sqlalchemy.select(*_PASTE_COLUMNS).where(
+    models.Paste.token == sqlalchemy.bindparam('token'),
+    models.Paste.expires_at > sqlalchemy.func.now(),
+)
+_GET_CONTENT_STMT = sqlalchemy.select(
+    models.Paste.content,
+    models.Paste.content_type,
+    models.Paste.sha256,
+).where(
+    models.Paste.token == sqlalchemy.bindparam('token'),
+    models.Paste.expires_at > sqlalchemy.func.now(),
+)
+# Answered entirely from the covering index on token (expires_at and sha256
+# are INCLUDE columns), so revalidation never touches the table heap.
+_GET_ETAG_STMT = sqlalchemy.select(models.Paste.sha256).where(
+    models.Paste.token == sqlalchemy.bindparam('token'),
+    models.Paste.expires_at > sqlalchemy.func.now(),
+)
+_DELETE_EXPIRED_STMT = sqlalchemy.delete(models.Paste).where(models.Paste.expires_at <= sqlalchemy.func.now())
+
 
 class SQLPasteStorage(base.PasteStorage):
     """SQL-based storage for pastes using PostgreSQL with SQLAlchemy Core."""
@@ -16,6 +51,7 @@ class SQLPasteStorage(base.PasteStorage):
         self,
         session: sqlalchemy.ext.asyncio.AsyncSession,
         worker_id: int = 0,
+        token_generator: utils.TokenGenerator | None = None,
     ) -> None:
         """
         Initialize the SQL storage.
@@ -23,9 +59,10 @@ class SQLPasteStorage(base.PasteStorage):
         Args:
             session: SQLAlchemy async session
             worker_id: Unique worker ID for Snowflake generator (0-1023)
+            token_generator: Shared token generator; a new one is created if omitted
         """
         self._session = session
-        self._token_generator = utils.TokenGenerator(worker_id=worker_id)
+        self._token_generator = token_generator or utils.TokenGenerator(worker_id=worker_id)
 
     async def create(
         self,
@@ -34,63 +71,102 @@ class SQLPasteStorage(base.PasteStorage):
         content_type: str = 'text/plain; charset=utf-8',
     ) -> base.StoredPaste:
         """Create and store a new paste in SQL database using Core."""
-        now = datetime.datetime.now(datetime.timezone.utc)
-        token, snowflake_id = self._token_generator.generate_token()
-
-        paste_data = {
-            'token': token,
-            'snowflake_id': snowflake_id,
-            'content': content,
-            'content_type': content_type,
-            'size_bytes': len(content.encode('utf-8')),
-            'sha256': utils.compute_sha256(content),
-            'created_at': now,
-            'expires_at': now + datetime.timedelta(seconds=expires_in_seconds),
-        }
-
-        stmt = sqlalchemy.insert(models.Paste).values(**paste_data)
-        await self._session.execute(stmt)
+        pastes = await self.create_many([(content, expires_in_seconds, content_type)])
+        return pastes[0]
 
-        return base.StoredPaste(
-            token=paste_data['token'],
-            content=paste_data['content'],
-            content_type=paste_data['content_type'],
-            size_bytes=paste_data['size_bytes'],
-            sha256=paste_data['sha256'],
-            created_at=paste_data['created_at'],
-            expires_at=paste_data['expires_at'],
-        )
+    async def create_many(
+        self,
+        items: list[tuple[str, int, str]],
+    ) -> list[base.StoredPaste]:
+        """
+        Create and store multiple pastes with a single INSERT round-trip.
+
+        Args:
+            items: List of (content, expires_in_seconds, content_type) tuples
+
+        Returns:
+            The stored pastes, in the same order as the input items
+        """
+        rows = []
+        for content, expires_in_seconds, content_type in items:
+            token, snowflake_id = self._token_generator.generate_token()
+            content_bytes = content.encode('utf-8')
+            rows.append(
+                {
+                    'token': token,
+                    'snowflake_id': snowflake_id,
+                    'content': content,
+                    'content_type': content_type,
+                    'size_bytes': len(content_bytes),
+                    'sha256': utils.compute_sha256(content_bytes),
+                    # Timestamps come from the database clock: created_at via
+                    # the column server_default, expires_at as NOW() + TTL.
+                    # RETURNING hands the resolved values back, so the stored
+                    # and reported expiry can never drift from the expiry
+                    # checks in the SELECT/DELETE statements above.
+                    'expires_at': sqlalchemy.func.now()
+                    + sqlalchemy.func.make_interval(0, 0, 0, 0, 0, 0, expires_in_seconds),
+                }
+            )
+
+        stmt = _INSERT_STMT.values(rows).returning(*_PASTE_COLUMNS)
+        result = await self._session.execute(stmt)
+
+        # RETURNING row order is not guaranteed for a multi-VALUES insert,
+        # so re-key by token (unique within the batch) to restore input order.
+        by_token = {row.token: row for row in result.all()}
+        return [self._to_stored_paste(by_token[row['token']]) for row in rows]
 
     async def get(self, token: str) -> base.StoredPaste | None:
-        """Retrieve a paste by token using ORM, or None if not found or expired."""
-        now = datetime.datetime.now(datetime.timezone.utc)
+        """Retrieve a paste by token using Core, or None if not found or expired."""
+        result = await self._session.execute(_GET_STMT, {'token': token})
+        row = result.first()
 
-        stmt = sqlalchemy.select(models.Paste).where(
-            models.Paste.token == token,
-            models.Paste.expires_at > now,
+        if row is None:
+            return None
+
+        return self._to_stored_paste(row)
+
+    async def get_content(self, token: str) -> base.PasteContent | None:
+        """Retrieve only the raw content payload of a paste."""
+        result = await self._session.execute(_GET_CONTENT_STMT, {'token': token})
+        row = result.first()
+
+        if row is None:
+            return None
+
+        return base.PasteContent(
+            content_bytes=row.content.encode('utf-8'),
+            content_type=row.content_type,
+            etag=f'"{row.sha256}"',
         )
 
-        result = await self._session.execute(stmt)
-        paste = result.scalar_one_or_none()
+    async def get_etag(self, token: str) -> str | None:
+        """Retrieve only the ETag of a paste."""
+        result = await self._session.execute(_GET_ETAG_STMT, {'token': token})
+        sha256 = result.scalar()
 
-        if paste is None:
+        if sha256 is None:
             return None
 
+        return f'"{sha256}"'
+
+    @staticmethod
+    def _to_stored_paste(row: sqlalchemy.Row) -> base.StoredPaste:
+        """Convert a database row to the internal StoredPaste representation."""
         return base.StoredPaste(
-            token=paste.token,
-            content=paste.content,
-            content_type=paste.content_type,
-            size_bytes=paste.size_bytes,
-            sha256=paste.sha256,
-            created_at=paste.created_at,
-            expires_at=paste.expires_at,
+            token=row.token,
+            content=row.content,
+            content_bytes=row.content.encode('utf-8'),
+            content_type=row.content_type,
+            size_bytes=row.size_bytes,
+            sha256=row.sha256,
+            etag=f'"{row.sha256}"',
+            created_at=row.created_at,
+            expires_at=row.expires_at,
         )
 
     async def cleanup_expired(self) -> int:
-        """Remove all expired pastes using ORM. Returns count of removed pastes."""
-        now = datetime.datetime.now(datetime.timezone.utc)
-
-        stmt = sqlalchemy.delete(models.Paste).where(models.Paste.expires_at <= now)
-
-        result = await self._session.execute(stmt)
+        """Remove all expired pastes using Core. Returns count of removed pastes."""
+        result = await self._session.execute(_DELETE_EXPIRED_STMT)
         return result.rowcount or 0
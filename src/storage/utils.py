@@ -1,11 +1,11 @@
 """Utility functions for storage operations."""
 
 import hashlib
-import string
 
 from src import snowflake
 
-_BASE62_ALPHABET = string.digits + string.ascii_letters  # 0-9, a-z, A-Z (62 chars)
+# URL-safe base64 alphabet (RFC 4648): A-Z, a-z, 0-9, '-', '_' (64 chars)
+_BASE64URL_ALPHABET = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_'
 
 
 class TokenGenerator:
@@ -20,46 +20,49 @@ class TokenGenerator:
         """
         self._snowflake = snowflake.SnowflakeGenerator(worker_id=worker_id)
 
-    def _id_to_base62(self, snowflake_id: int) -> str:
+    def _id_to_base64url(self, snowflake_id: int) -> str:
         """
-        Convert a Snowflake ID to a base62 string.
+        Convert a Snowflake ID to a base64url string.
 
         Args:
             snowflake_id: 64-bit Snowflake ID
 
         Returns:
-            11-character base62 string, zero-padded for consistent length
+            11-character base64url string of fixed length
         """
-        if snowflake_id == 0:
-            return '0'.zfill(11)
+        # 64 bits group into 11 six-bit chunks (66 bits, top two bits zero),
+        # so each character is a shift and a mask - no division at all.
+        buffer = bytearray(11)
+        shift = 60
+        for i in range(11):
+            buffer[i] = _BASE64URL_ALPHABET[(snowflake_id >> shift) & 0x3F]
+            shift -= 6
 
-        result = []
-        while snowflake_id > 0:
-            snowflake_id, remainder = divmod(snowflake_id, 62)
-            result.append(_BASE62_ALPHABET[remainder])
-
-        return ''.join(reversed(result)).zfill(11)
+        return buffer.decode('ascii')
 
     def generate_token(self) -> tuple[str, int]:
         """
-        Generate a unique Snowflake-based base62 token.
+        Generate a unique Snowflake-based base64url token.
 
         Returns:
             Tuple of (token, snowflake_id)
         """
         snowflake_id = self._snowflake.generate_id()
-        token = self._id_to_base62(snowflake_id)
+        token = self._id_to_base64url(snowflake_id)
         return token, snowflake_id
 
 
-def compute_sha256(content: str) -> str:
+def compute_sha256(content: bytes) -> str:
     """
-    Compute SHA256 hash of content.
+    Compute SHA256 hash of already-encoded content.
+
+    Both storage backends encode paste content exactly once on create and
+    hash those bytes, so no str fallback (and no second UTF-8 pass) is kept.
 
     Args:
-        content: The content to hash
+        content: The content bytes to hash
 
     Returns:
         Hexadecimal SHA256 hash string
     """
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    return hashlib.sha256(content).hexdigest()
@@ -3,21 +3,29 @@
 import datetime
 
 import httpx
+import orjson
 import pytest
 
 import tests.utils
 from src.storage.db import models
 
+# Built once at import so the 64KiB+1 string is not reallocated per run
+_OVERSIZE_CONTENT = 'x' * 65537  # Max is 65536
+
+# Request bodies are serialized with orjson instead of httpx's json= path
+# (stdlib json); the explicit header replaces the one json= would set.
+_JSON_HEADERS = {'content-type': 'application/json'}
+
 
 @pytest.mark.asyncio
 async def test_create_paste(async_client: httpx.AsyncClient) -> None:
     """Test creating a paste with valid data."""
     payload = {'content': 'Hello, World!', 'expires_in_seconds': 3600}
 
-    response = await async_client.post('/api/v1/pastes', json=payload)
+    response = await async_client.post('/api/v1/pastes', content=orjson.dumps(payload), headers=_JSON_HEADERS)
 
     assert response.status_code == 201
-    assert response.json() == {
+    assert orjson.loads(response.content) == {
         'token': tests.utils.AnyStringOfLength(11),
         'expires_at': tests.utils.AnyFutureDatetime(min_seconds=3590, max_seconds=3610),
         'size_bytes': 13,
@@ -31,10 +39,10 @@ async def test_create_paste_with_defaults(async_client: httpx.AsyncClient) -> No
     """Test creating a paste with default expiration."""
     payload = {'content': 'Test content'}
 
-    response = await async_client.post('/api/v1/pastes', json=payload)
+    response = await async_client.post('/api/v1/pastes', content=orjson.dumps(payload), headers=_JSON_HEADERS)
 
     assert response.status_code == 201
-    assert response.json() == {
+    assert orjson.loads(response.content) == {
         'token': tests.utils.AnyStringOfLength(11),
         'expires_at': tests.utils.AnyFutureDatetime(min_seconds=86390, max_seconds=86410),
         'size_bytes': 12,
@@ -48,7 +56,7 @@ async def test_create_paste_empty_content(async_client: httpx.AsyncClient) -> No
     """Test creating a paste with empty content returns 422."""
     payload = {'content': ''}
 
-    response = await async_client.post('/api/v1/pastes', json=payload)
+    response = await async_client.post('/api/v1/pastes', content=orjson.dumps(payload), headers=_JSON_HEADERS)
 
     assert response.status_code == 422
 
@@ -56,9 +64,9 @@ async def test_create_paste_empty_content(async_client: httpx.AsyncClient) -> No
 @pytest.mark.asyncio
 async def test_create_paste_content_too_large(async_client: httpx.AsyncClient) -> None:
     """Test creating a paste with content exceeding max size returns 422."""
-    payload = {'content': 'x' * 65537}  # Max is 65536
+    payload = {'content': _OVERSIZE_CONTENT}
 
-    response = await async_client.post('/api/v1/pastes', json=payload)
+    response = await async_client.post('/api/v1/pastes', content=orjson.dumps(payload), headers=_JSON_HEADERS)
 
     assert response.status_code == 422
 
@@ -68,12 +76,12 @@ async def test_create_paste_invalid_expiration(async_client: httpx.AsyncClient)
     """Test creating a paste with invalid expiration returns 422."""
     # Too short
     payload = {'content': 'test', 'expires_in_seconds': 30}
-    response = await async_client.post('/api/v1/pastes', json=payload)
+    response = await async_client.post('/api/v1/pastes', content=orjson.dumps(payload), headers=_JSON_HEADERS)
     assert response.status_code == 422
 
     # Too long
     payload = {'content': 'test', 'expires_in_seconds': 700000}
-    response = await async_client.post('/api/v1/pastes', json=payload)
+    response = await async_client.post('/api/v1/pastes', content=orjson.dumps(payload), headers=_JSON_HEADERS)
     assert response.status_code == 422
 
 
@@ -82,16 +90,18 @@ async def test_get_paste(async_client: httpx.AsyncClient) -> None:
     """Test retrieving a paste by token."""
     # Create a paste first
     create_payload = {'content': 'Retrieve me!', 'expires_in_seconds': 3600}
-    create_response = await async_client.post('/api/v1/pastes', json=create_payload)
+    create_response = await async_client.post(
+        '/api/v1/pastes', content=orjson.dumps(create_payload), headers=_JSON_HEADERS
+    )
     assert create_response.status_code == 201
-    create_data = create_response.json()
+    create_data = orjson.loads(create_response.content)
     token = create_data['token']
 
     # Retrieve the paste
     response = await async_client.get(f'/api/v1/pastes/{token}')
 
     assert response.status_code == 200
-    assert response.json() == {
+    assert orjson.loads(response.content) == {
         'token': token,
         'content': 'Retrieve me!',
         'expires_at': create_data['expires_at'],
@@ -138,10 +148,13 @@ async def test_get_paste_content(async_client: httpx.AsyncClient) -> None:
     """Test retrieving raw paste content."""
     # Create a paste first
     create_payload = {'content': 'Raw content here!', 'expires_in_seconds': 3600}
-    create_response = await async_client.post('/api/v1/pastes', json=create_payload)
+    create_response = await async_client.post(
+        '/api/v1/pastes', content=orjson.dumps(create_payload), headers=_JSON_HEADERS
+    )
     assert create_response.status_code == 201
-    token = create_response.json()['token']
-    sha256 = create_response.json()['sha256']
+    create_data = orjson.loads(create_response.content)
+    token = create_data['token']
+    sha256 = create_data['sha256']
 
     # Retrieve the raw content
     response = await async_client.get(f'/api/v1/pastes/{token}/content')
@@ -153,6 +166,39 @@ async def test_get_paste_content(async_client: httpx.AsyncClient) -> None:
     assert response.headers['etag'] == f'"{sha256}"'
 
 
+@pytest.mark.asyncio
+async def test_get_paste_content_if_none_match(async_client: httpx.AsyncClient) -> None:
+    """Test that a matching If-None-Match header returns 304 without a body."""
+    # Create a paste first
+    create_payload = {'content': 'Cached content', 'expires_in_seconds': 3600}
+    create_response = await async_client.post(
+        '/api/v1/pastes', content=orjson.dumps(create_payload), headers=_JSON_HEADERS
+    )
+    assert create_response.status_code == 201
+    create_data = orjson.loads(create_response.content)
+    token = create_data['token']
+    sha256 = create_data['sha256']
+
+    # Matching ETag revalidates without re-sending the body
+    response = await async_client.get(
+        f'/api/v1/pastes/{token}/content',
+        headers={'If-None-Match': f'"{sha256}"'},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b''
+    assert response.headers['etag'] == f'"{sha256}"'
+
+    # Stale ETag falls through to a full response
+    response = await async_client.get(
+        f'/api/v1/pastes/{token}/content',
+        headers={'If-None-Match': '"stale"'},
+    )
+
+    assert response.status_code == 200
+    assert response.text == 'Cached content'
+
+
 @pytest.mark.asyncio
 async def test_get_paste_content_not_found(async_client: httpx.AsyncClient) -> None:
     """Test retrieving content for non-existent paste returns 404."""
@@ -190,9 +236,11 @@ async def test_get_paste_content_with_unicode(async_client: httpx.AsyncClient) -
     # Create a paste with UTF-8 content
     content = 'Hello 世界 🌍 Emoji test!'
     create_payload = {'content': content, 'expires_in_seconds': 3600}
-    create_response = await async_client.post('/api/v1/pastes', json=create_payload)
+    create_response = await async_client.post(
+        '/api/v1/pastes', content=orjson.dumps(create_payload), headers=_JSON_HEADERS
+    )
     assert create_response.status_code == 201
-    token = create_response.json()['token']
+    token = orjson.loads(create_response.content)['token']
 
     # Retrieve the raw content
     response = await async_client.get(f'/api/v1/pastes/{token}/content')
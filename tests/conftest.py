@@ -1,9 +1,9 @@
 """Pytest configuration and fixtures for API tests."""
 
+import asyncio
 import collections.abc
 import os
 
-import fastapi.testclient
 import httpx
 import pytest
 import sqlalchemy
@@ -82,77 +82,101 @@ def setup_test_database():
 
 
 @pytest.fixture(scope='session')
-def test_engine():
+async def test_engine():
     """
-    Create a test database engine for the entire test session.
+    Create a pooled test database engine for the entire test session.
 
-    This engine connects to the test database created by setup_test_database fixture.
+    This engine connects to the test database created by setup_test_database
+    fixture. Connections are pooled and reused across tests (all tests share
+    the session-scoped event loop), so only the first use of a connection
+    pays the TCP/auth handshake.
     """
-    return sqlalchemy.ext.asyncio.create_async_engine(
+    engine = sqlalchemy.ext.asyncio.create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
-        poolclass=sqlalchemy.pool.NullPool,
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=False,
     )
 
+    yield engine
+
+    await engine.dispose()
 
-@pytest.fixture(autouse=True)
-async def cleanup_tables(test_engine):
-    """
-    Cleanup all table data after each test for isolation.
 
-    This fixture runs automatically after every test and truncates
-    all tables to ensure test isolation without dropping/recreating schema.
+@pytest.fixture(scope='session', autouse=True)
+async def warm_pool(setup_test_database, test_engine):
+    """
+    Pre-warm the connection pool before the first test runs.
 
-    Uses SQLAlchemy metadata to get all tables dynamically.
+    Opens a handful of connections concurrently and returns them to the pool,
+    so the TCP/auth handshake cost is paid up front instead of skewing the
+    first few tests.
     """
-    yield  # Let the test run first
 
-    # Cleanup after test
-    async with test_engine.begin() as conn:
-        for table in reversed(src.storage.db.Base.metadata.sorted_tables):
-            await conn.execute(sqlalchemy.text(f'TRUNCATE TABLE {table.name} CASCADE'))
+    async def _checkout():
+        async with test_engine.connect() as conn:
+            await conn.execute(sqlalchemy.text('SELECT 1'))
+
+    await asyncio.gather(*(_checkout() for _ in range(5)))
 
 
 @pytest.fixture
-def client() -> fastapi.testclient.TestClient:
-    """Create a test client for the FastAPI app."""
-    return fastapi.testclient.TestClient(src.app.app)
+async def db_connection(test_engine):
+    """
+    Provide a per-test connection wrapped in a transaction that is rolled back.
+
+    Rolling back the outer transaction at teardown undoes everything a test
+    wrote, which is far cheaper than truncating tables after every test.
+    """
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+
+        yield conn
+
+        await transaction.rollback()
+
+
+@pytest.fixture(scope='session')
+async def shared_async_client() -> collections.abc.AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Create one httpx client over an ASGI transport for the whole session.
+
+    The client and transport are stateless between requests; building them
+    once avoids the per-test httpx.AsyncClient construction and teardown.
+    """
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=src.app.app),
+        base_url='http://test',
+    ) as client:
+        yield client
 
 
 @pytest.fixture
 async def async_client(
-    test_engine: sqlalchemy.ext.asyncio.AsyncEngine,
+    shared_async_client: httpx.AsyncClient,
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
 ) -> collections.abc.AsyncGenerator[httpx.AsyncClient, None]:
     """
-    Create an async test client with test database.
+    Provide the shared async test client wired to the per-test database.
 
-    Overrides the database dependency to use test database engine.
+    Overrides the database dependency with the per-test savepoint-joined
+    session, so API requests and direct db_session access observe the same
+    uncommitted data and everything is discarded at test teardown.
     """
 
     async def override_get_db():
-        async_session = sqlalchemy.ext.asyncio.async_sessionmaker(
-            test_engine,
-            class_=sqlalchemy.ext.asyncio.AsyncSession,
-            expire_on_commit=False,
-        )
-        async with async_session() as session:
-            try:
-                yield session
-                await session.commit()
-            except Exception:
-                await session.rollback()
-                raise
-            finally:
-                await session.close()
+        try:
+            yield db_session
+            await db_session.commit()  # Releases the savepoint, not the outer transaction
+        except Exception:
+            await db_session.rollback()
+            raise
 
     # Override the database dependency
     src.app.app.dependency_overrides[src.storage.db.get_db] = override_get_db
 
-    async with httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=src.app.app),
-        base_url='http://test',
-    ) as client:
-        yield client
+    yield shared_async_client
 
     # Clear overrides after test
     src.app.app.dependency_overrides.clear()
@@ -160,18 +184,21 @@ async def async_client(
 
 @pytest.fixture
 async def db_session(
-    test_engine: sqlalchemy.ext.asyncio.AsyncEngine,
+    db_connection: sqlalchemy.ext.asyncio.AsyncConnection,
 ) -> collections.abc.AsyncGenerator[sqlalchemy.ext.asyncio.AsyncSession, None]:
     """
-    Provide a database session for tests that need to directly manipulate data.
+    Provide a database session joined to the per-test rollback transaction.
 
-    This session uses the same test database as async_client.
+    The session runs inside the db_connection transaction via savepoints:
+    session.commit() only releases a savepoint, and the outer rollback at
+    teardown wipes all data written during the test.
     """
-    async_session = sqlalchemy.ext.asyncio.async_sessionmaker(
-        test_engine,
-        class_=sqlalchemy.ext.asyncio.AsyncSession,
+    session = sqlalchemy.ext.asyncio.AsyncSession(
+        bind=db_connection,
         expire_on_commit=False,
+        join_transaction_mode='create_savepoint',
     )
-    async with async_session() as session:
-        yield session
-        await session.commit()
+
+    yield session
+
+    await session.close()
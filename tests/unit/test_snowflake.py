@@ -5,6 +5,12 @@ import pytest
 import src.snowflake
 
 
+@pytest.fixture(scope='module')
+def generator() -> src.snowflake.SnowflakeGenerator:
+    """Share one generator across the module; its sequence state never breaks assertions."""
+    return src.snowflake.SnowflakeGenerator(worker_id=0)
+
+
 def test_snowflake_init_invalid_worker_id() -> None:
     """Test that invalid worker IDs raise ValueError."""
     with pytest.raises(ValueError, match="worker_id must be between 0 and 1023"):
@@ -14,9 +20,8 @@ def test_snowflake_init_invalid_worker_id() -> None:
         src.snowflake.SnowflakeGenerator(worker_id=1024)
 
 
-def test_generate_id() -> None:
+def test_generate_id(generator: src.snowflake.SnowflakeGenerator) -> None:
     """Test generating a Snowflake ID."""
-    generator = src.snowflake.SnowflakeGenerator(worker_id=0)
     snowflake_id = generator.generate_id()
 
     assert isinstance(snowflake_id, int)
@@ -24,17 +29,16 @@ def test_generate_id() -> None:
     assert snowflake_id.bit_length() <= 64
 
 
-def test_generate_unique_ids() -> None:
+def test_generate_unique_ids(generator: src.snowflake.SnowflakeGenerator) -> None:
     """Test that generated IDs are unique."""
-    generator = src.snowflake.SnowflakeGenerator(worker_id=0)
-    ids = {generator.generate_id() for _ in range(1000)}
+    generate_id = generator.generate_id  # Skip the attribute lookup in the hot loop
+    ids = {generate_id() for _ in range(1000)}
 
     assert len(ids) == 1000  # All unique
 
 
-def test_generate_sequential_ids() -> None:
+def test_generate_sequential_ids(generator: src.snowflake.SnowflakeGenerator) -> None:
     """Test that IDs generated in same millisecond are sequential."""
-    generator = src.snowflake.SnowflakeGenerator(worker_id=0)
     id1 = generator.generate_id()
     id2 = generator.generate_id()
     id3 = generator.generate_id()
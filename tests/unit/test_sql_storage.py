@@ -0,0 +1,24 @@
+"""Unit tests for the SQL storage backend."""
+
+import sqlalchemy.ext.asyncio
+
+import src.storage.sql
+
+
+async def test_create_many_preserves_input_order(
+    db_session: sqlalchemy.ext.asyncio.AsyncSession,
+) -> None:
+    """Test that batched creation returns pastes in input order."""
+    storage = src.storage.sql.SQLPasteStorage(session=db_session)
+    items = [(f'Batch content {i}', 3600, 'text/plain; charset=utf-8') for i in range(5)]
+
+    pastes = await storage.create_many(items)
+
+    assert [paste.content for paste in pastes] == [content for content, _, _ in items]
+    assert len({paste.token for paste in pastes}) == len(items)
+
+    # Every paste is retrievable under the token it was returned with
+    for paste in pastes:
+        stored = await storage.get(paste.token)
+        assert stored is not None
+        assert stored.content == paste.content
@@ -1,13 +1,46 @@
 """Unit tests for storage layer."""
 
+import asyncio
 import datetime
 
+import freezegun
+import pytest
+
 import src.storage.memory
 import tests.utils
 
+# Fixed clock for tests that assert timestamps: exact comparisons replace
+# the fuzzy now()-relative matchers, which re-read the wall clock per check.
+_FROZEN_NOW = datetime.datetime(2026, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+
+# Multibyte fixtures encoded once at import; encode() defaults to utf-8.
+_UTF8_CONTENT = 'Hello 世界 🌍'
+_UTF8_CONTENT_BYTES = _UTF8_CONTENT.encode()
+_MULTIBYTE_CONTENT = '日本'
+_MULTIBYTE_CONTENT_BYTES = _MULTIBYTE_CONTENT.encode()
+
+
+@pytest.fixture(scope='module')
+def storage() -> src.storage.memory.InMemoryPasteStorage:
+    """Share one storage instance across the module; reset_storage isolates tests."""
+    return src.storage.memory.InMemoryPasteStorage()
+
+
+@pytest.fixture(autouse=True)
+def reset_storage(storage: src.storage.memory.InMemoryPasteStorage):
+    """Clear storage state after each test instead of rebuilding the instance."""
+    yield
+
+    storage._pastes.clear()
+    storage._expiry_heap.clear()
+
 
+@freezegun.freeze_time(_FROZEN_NOW)
 async def test_create_paste() -> None:
     """Test creating and storing a paste."""
+    # Own storage instance: the shared generator's last-seen timestamp may
+    # hold real wall-clock time from another test, and a frozen past clock
+    # would then trip the Snowflake clock-moved-backwards guard.
     storage = src.storage.memory.InMemoryPasteStorage()
 
     paste = await storage.create(
@@ -22,32 +55,26 @@ async def test_create_paste() -> None:
     assert paste.size_bytes == 12  # len('Test content'.encode('utf-8'))
     assert paste.sha256 == tests.utils.AnyString()
     assert len(paste.sha256) == 64
-    assert paste.created_at == tests.utils.AnyRecentDatetime()
+    assert paste.created_at == _FROZEN_NOW
+    assert paste.expires_at == _FROZEN_NOW + datetime.timedelta(seconds=3600)
 
-    # Verify expiration is approximately 3600 seconds in future
-    assert paste.expires_at == tests.utils.AnyFutureDatetime(min_seconds=3590, max_seconds=3610)
 
-
-async def test_create_paste_with_utf8_content() -> None:
+async def test_create_paste_with_utf8_content(storage: src.storage.memory.InMemoryPasteStorage) -> None:
     """Test creating a paste with UTF-8 content."""
-    storage = src.storage.memory.InMemoryPasteStorage()
-
     paste = await storage.create(
-        content='Hello 世界 🌍',
+        content=_UTF8_CONTENT,
         expires_in_seconds=3600,
         content_type='text/plain; charset=utf-8',
     )
 
-    assert paste.content == 'Hello 世界 🌍'
+    assert paste.content == _UTF8_CONTENT
     # UTF-8 encoded size is larger than character count
-    assert paste.size_bytes == len('Hello 世界 🌍'.encode('utf-8'))
-    assert paste.size_bytes > len('Hello 世界 🌍')
+    assert paste.size_bytes == len(_UTF8_CONTENT_BYTES)
+    assert paste.size_bytes > len(_UTF8_CONTENT)
 
 
-async def test_get_existing_paste() -> None:
+async def test_get_existing_paste(storage: src.storage.memory.InMemoryPasteStorage) -> None:
     """Test retrieving an existing non-expired paste."""
-    storage = src.storage.memory.InMemoryPasteStorage()
-
     created = await storage.create(
         content='Retrievable content',
         expires_in_seconds=3600,
@@ -64,45 +91,39 @@ async def test_get_existing_paste() -> None:
     assert retrieved.expires_at == created.expires_at
 
 
-async def test_get_nonexistent_paste() -> None:
+async def test_get_nonexistent_paste(storage: src.storage.memory.InMemoryPasteStorage) -> None:
     """Test retrieving a non-existent paste returns None."""
-    storage = src.storage.memory.InMemoryPasteStorage()
-
     result = await storage.get('nonexistent')
 
     assert result is None
 
 
-async def test_get_expired_paste() -> None:
-    """Test that retrieving an expired paste returns None and removes it."""
-    storage = src.storage.memory.InMemoryPasteStorage()
-
-    # Create a paste
+async def test_get_expired_paste(storage: src.storage.memory.InMemoryPasteStorage) -> None:
+    """Test that retrieving an expired paste returns None without evicting it."""
+    # Create a paste that is already expired
     paste = await storage.create(
         content='Will expire',
-        expires_in_seconds=3600,
+        expires_in_seconds=-1,
         content_type='text/plain; charset=utf-8',
     )
 
-    # Manually expire it by setting expiration to the past
-    paste.expires_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=1)
-    storage._pastes[paste.token] = paste
-
     # Try to retrieve - should return None
     result = await storage.get(paste.token)
 
     assert result is None
-    # Verify it was cleaned up
+    # Eviction happens via cleanup_expired, not on the read path
+    assert paste.token in storage._pastes
+    assert await storage.cleanup_expired() == 1
     assert paste.token not in storage._pastes
 
 
-async def test_create_multiple_pastes() -> None:
+async def test_create_multiple_pastes(storage: src.storage.memory.InMemoryPasteStorage) -> None:
     """Test creating multiple pastes with unique tokens."""
-    storage = src.storage.memory.InMemoryPasteStorage()
-
-    paste1 = await storage.create(content='First', expires_in_seconds=3600)
-    paste2 = await storage.create(content='Second', expires_in_seconds=3600)
-    paste3 = await storage.create(content='Third', expires_in_seconds=3600)
+    paste1, paste2, paste3 = await asyncio.gather(
+        storage.create(content='First', expires_in_seconds=3600),
+        storage.create(content='Second', expires_in_seconds=3600),
+        storage.create(content='Third', expires_in_seconds=3600),
+    )
 
     # All tokens should be unique
     assert paste1.token != paste2.token
@@ -115,22 +136,15 @@ async def test_create_multiple_pastes() -> None:
     assert await storage.get(paste3.token) is not None
 
 
-async def test_cleanup_expired() -> None:
+async def test_cleanup_expired(storage: src.storage.memory.InMemoryPasteStorage) -> None:
     """Test manual cleanup of expired pastes."""
-    storage = src.storage.memory.InMemoryPasteStorage()
-    now = datetime.datetime.now(datetime.timezone.utc)
-
-    # Create some pastes
-    paste1 = await storage.create(content='Active 1', expires_in_seconds=3600)
-    paste2 = await storage.create(content='Expired 1', expires_in_seconds=3600)
-    paste3 = await storage.create(content='Expired 2', expires_in_seconds=3600)
-    paste4 = await storage.create(content='Active 2', expires_in_seconds=3600)
-
-    # Manually expire some pastes
-    paste2.expires_at = now - datetime.timedelta(seconds=10)
-    paste3.expires_at = now - datetime.timedelta(seconds=5)
-    storage._pastes[paste2.token] = paste2
-    storage._pastes[paste3.token] = paste3
+    # Create a mix of active and already-expired pastes
+    paste1, paste2, paste3, paste4 = await asyncio.gather(
+        storage.create(content='Active 1', expires_in_seconds=3600),
+        storage.create(content='Expired 1', expires_in_seconds=-10),
+        storage.create(content='Expired 2', expires_in_seconds=-5),
+        storage.create(content='Active 2', expires_in_seconds=3600),
+    )
 
     # Run cleanup
     removed_count = await storage.cleanup_expired()
@@ -144,10 +158,8 @@ async def test_cleanup_expired() -> None:
     assert paste3.token not in storage._pastes
 
 
-async def test_cleanup_expired_with_no_expired() -> None:
+async def test_cleanup_expired_with_no_expired(storage: src.storage.memory.InMemoryPasteStorage) -> None:
     """Test cleanup when there are no expired pastes."""
-    storage = src.storage.memory.InMemoryPasteStorage()
-
     paste1 = await storage.create(content='Active 1', expires_in_seconds=3600)
     paste2 = await storage.create(content='Active 2', expires_in_seconds=3600)
 
@@ -158,17 +170,15 @@ async def test_cleanup_expired_with_no_expired() -> None:
     assert await storage.get(paste2.token) is not None
 
 
-async def test_paste_size_calculation() -> None:
+async def test_paste_size_calculation(storage: src.storage.memory.InMemoryPasteStorage) -> None:
     """Test that paste size is correctly calculated in bytes."""
-    storage = src.storage.memory.InMemoryPasteStorage()
-
     # ASCII content
     paste1 = await storage.create(content='abc', expires_in_seconds=3600)
     assert paste1.size_bytes == 3
 
     # UTF-8 content with multibyte characters
-    paste2 = await storage.create(content='日本', expires_in_seconds=3600)
-    assert paste2.size_bytes == len('日本'.encode('utf-8'))
+    paste2 = await storage.create(content=_MULTIBYTE_CONTENT, expires_in_seconds=3600)
+    assert paste2.size_bytes == len(_MULTIBYTE_CONTENT_BYTES)
     assert paste2.size_bytes > 2  # Each character is multiple bytes
 
     # Empty content
@@ -0,0 +1,34 @@
+"""Unit tests for storage utility functions."""
+
+import hashlib
+
+import src.storage.utils
+
+# Deletion tables built once at import: translate() strips every allowed
+# character in a single C-level pass, so a valid string deletes to ''.
+_NON_TOKEN_CHARS = str.maketrans('', '', 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_')
+_NON_HEX_CHARS = str.maketrans('', '', '0123456789abcdef')
+
+
+def test_generate_token() -> None:
+    """Test that generated tokens are fixed-length base64url strings."""
+    generator = src.storage.utils.TokenGenerator(worker_id=0)
+
+    token, snowflake_id = generator.generate_token()
+
+    assert len(token) == 11
+    assert token.translate(_NON_TOKEN_CHARS) == ''
+    assert snowflake_id > 0
+    # Token is a stable encoding of the ID
+    assert generator._id_to_base64url(snowflake_id) == token
+
+
+def test_compute_sha256() -> None:
+    """Test SHA256 computation over encoded content."""
+    content = 'Test content'.encode('utf-8')
+
+    digest = src.storage.utils.compute_sha256(content)
+
+    assert len(digest) == 64
+    assert digest.translate(_NON_HEX_CHARS) == ''
+    assert digest == hashlib.sha256(content).hexdigest()
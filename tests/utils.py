@@ -1,6 +1,25 @@
 """Test utilities for flexible assertions."""
 
 import datetime
+import functools
+
+_UTC = datetime.timezone.utc
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime.datetime | None:
+    """Parse an ISO 8601 string, mapping a trailing 'Z' suffix to UTC.
+
+    Cached: API tests compare the same response timestamp against several
+    matchers, and repeat comparisons become a dict hit.
+    """
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
 
 
 class Any:
@@ -46,97 +65,76 @@ class AnyStringOfLength:
         return f'<AnyStringOfLength({self.length})>'
 
 
-class AnyDatetime:
-    """Matches any datetime string or datetime object with fuzzy comparison."""
-
-    def __init__(self, expected_time: datetime.datetime | None = None, tolerance_seconds: int = 5) -> None:
-        """Initialize with tolerance in seconds for comparison."""
-        self.expected_time = expected_time
-        self.tolerance_seconds = tolerance_seconds
+class DatetimeMatcher:
+    """Matches a datetime string or object whose offset from an anchor falls in a window.
+
+    Offsets are in seconds relative to the anchor (a fixed datetime, or now()
+    at comparison time when omitted); negative offsets lie in the past. A None
+    bound leaves that side open, and with both bounds None any valid datetime
+    matches. The former AnyDatetime/AnyRecentDatetime/AnyFutureDatetime
+    matchers are thin factories over this single comparison path.
+    """
+
+    def __init__(
+        self,
+        anchor: datetime.datetime | None = None,
+        min_offset_seconds: float | None = None,
+        max_offset_seconds: float | None = None,
+        label: str = 'DatetimeMatcher',
+    ) -> None:
+        self.anchor = anchor
+        self.min_offset_seconds = min_offset_seconds
+        self.max_offset_seconds = max_offset_seconds
+        self.label = label
 
     def __eq__(self, other: object) -> bool:
         parsed_time: datetime.datetime | None = None
 
         if isinstance(other, str):
-            try:
-                # Parse ISO 8601 datetime string
-                parsed_time = datetime.datetime.fromisoformat(other.replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
+            # Parse ISO 8601 datetime string
+            parsed_time = _parse_iso(other)
+            if parsed_time is None:
                 return False
         elif isinstance(other, datetime.datetime):
             parsed_time = other
         else:
             return False
 
-        # If no expected time set, just validate it's a valid datetime
-        if self.expected_time is None:
+        # If no window set, just validate it's a valid datetime
+        if self.min_offset_seconds is None and self.max_offset_seconds is None:
             return True
 
-        # Compare with tolerance
-        time_diff = abs((parsed_time - self.expected_time).total_seconds())
-        return time_diff <= self.tolerance_seconds
-
-    def __repr__(self) -> str:
-        return f'<AnyDatetime(tolerance={self.tolerance_seconds}s)>'
-
+        anchor = self.anchor or datetime.datetime.now(_UTC)
+        offset = (parsed_time - anchor).total_seconds()
 
-class AnyRecentDatetime:
-    """Matches a datetime string or object that is within specified seconds from now."""
-
-    def __init__(self, max_age_seconds: int = 5) -> None:
-        """Initialize with maximum age in seconds."""
-        self.max_age_seconds = max_age_seconds
-
-    def __eq__(self, other: object) -> bool:
-        parsed_time: datetime.datetime | None = None
-
-        if isinstance(other, str):
-            try:
-                parsed_time = datetime.datetime.fromisoformat(other.replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
-                return False
-        elif isinstance(other, datetime.datetime):
-            parsed_time = other
-        else:
+        if self.min_offset_seconds is not None and offset < self.min_offset_seconds:
             return False
-
-        now = datetime.datetime.now(datetime.timezone.utc)
-        age = (now - parsed_time).total_seconds()
-        return 0 <= age <= self.max_age_seconds
+        if self.max_offset_seconds is not None and offset > self.max_offset_seconds:
+            return False
+        return True
 
     def __repr__(self) -> str:
-        return f'<AnyRecentDatetime(max_age={self.max_age_seconds}s)>'
+        return f'<{self.label}(min={self.min_offset_seconds}s, max={self.max_offset_seconds}s)>'
 
 
-class AnyFutureDatetime:
-    """Matches a datetime string or object that is in the future within specified range."""
+def AnyDatetime(expected_time: datetime.datetime | None = None, tolerance_seconds: int = 5) -> DatetimeMatcher:  # noqa: N802
+    """Match any datetime; with expected_time set, within the given tolerance of it."""
+    if expected_time is None:
+        return DatetimeMatcher(label='AnyDatetime')
 
-    def __init__(self, min_seconds: int = 0, max_seconds: int | None = None) -> None:
-        """Initialize with expected future time range in seconds from now."""
-        self.min_seconds = min_seconds
-        self.max_seconds = max_seconds
+    return DatetimeMatcher(
+        anchor=expected_time,
+        min_offset_seconds=-tolerance_seconds,
+        max_offset_seconds=tolerance_seconds,
+        label='AnyDatetime',
+    )
 
-    def __eq__(self, other: object) -> bool:
-        parsed_time: datetime.datetime | None = None
 
-        if isinstance(other, str):
-            try:
-                parsed_time = datetime.datetime.fromisoformat(other.replace('Z', '+00:00'))
-            except (ValueError, AttributeError):
-                return False
-        elif isinstance(other, datetime.datetime):
-            parsed_time = other
-        else:
-            return False
-
-        now = datetime.datetime.now(datetime.timezone.utc)
-        seconds_until = (parsed_time - now).total_seconds()
+def AnyRecentDatetime(max_age_seconds: int = 5) -> DatetimeMatcher:  # noqa: N802
+    """Match a datetime that is at most max_age_seconds in the past."""
+    return DatetimeMatcher(min_offset_seconds=-max_age_seconds, max_offset_seconds=0, label='AnyRecentDatetime')
 
-        if seconds_until < self.min_seconds:
-            return False
-        if self.max_seconds is not None and seconds_until > self.max_seconds:
-            return False
-        return True
 
-    def __repr__(self) -> str:
-        return f'<AnyFutureDatetime(min={self.min_seconds}s, max={self.max_seconds}s)>'
+def AnyFutureDatetime(min_seconds: int = 0, max_seconds: int | None = None) -> DatetimeMatcher:  # noqa: N802
+    """Match a datetime between min_seconds and max_seconds in the future."""
+    return DatetimeMatcher(min_offset_seconds=min_seconds, max_offset_seconds=max_seconds, label='AnyFutureDatetime')